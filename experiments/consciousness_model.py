@@ -6,16 +6,51 @@ from recursive contradictions in the RSO framework.
 """
 
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-import matplotlib.pyplot as plt
 from pathlib import Path
 
-# Add parent directory to path for imports
 import sys
-sys.path.append(str(Path(__file__).parent.parent / 'src'))
 
-from xi import XiOscillator, XiSymbolic
+try:
+    # Import through the package so the module object (and any caches on
+    # it) is shared with every other consumer of src.xi.
+    from src.xi import XiOscillator, XiSymbolic
+except ImportError:
+    # Running as a standalone script from a source checkout.
+    sys.path.append(str(Path(__file__).parent.parent))
+    from src.xi import XiOscillator, XiSymbolic
+
+
+# Shared PCG64 generator: one vectorized draw per node instead of a
+# legacy np.random.choice dispatch per predicate.
+_rng = np.random.default_rng()
+
+
+def _linreg_slope(y: np.ndarray) -> float:
+    """Closed-form least-squares slope of y against its index.
+
+    O(n) dot products instead of np.polyfit's Vandermonde matrix and
+    SVD solve — identical result for a degree-1 fit.
+    """
+    n = y.size
+    x = np.arange(n, dtype=np.float64)
+    sx = x.sum()
+    return (n * (x * y).sum() - sx * y.sum()) / (n * (x * x).sum() - sx * sx)
+
+
+def _precompute_node_trajectories(initial_states: List[bool], steps: int) -> np.ndarray:
+    """Worker for parallel precomputation: build oscillators from their
+    initial states and return the stacked (predicates, steps) uint8 matrix.
+
+    Module-level so it can be pickled into a ProcessPoolExecutor worker.
+    """
+    trajectories = [
+        np.asarray(XiOscillator(initial).iterate(steps), dtype=np.uint8)
+        for initial in initial_states
+    ]
+    return np.stack(trajectories)
 
 
 @dataclass
@@ -61,39 +96,89 @@ class ConsciousnessNode:
         self.predicates = [p.strip() for p in predicates]
         
         try:
-            self.oscillators = {p: XiOscillator(bool(np.random.choice([True, False]))) 
-                               for p in self.predicates}
+            bits = _rng.integers(0, 2, size=len(self.predicates), dtype=np.uint8)
+            self.oscillators = {p: XiOscillator(bool(b))
+                                for p, b in zip(self.predicates, bits)}
         except Exception as e:
             raise RuntimeError(f"Failed to initialize oscillators: {e}")
             
         self.awareness_level = 0.0
         self.integration_strength = 0.0
-    
+        self._trajectory: np.ndarray = None  # (predicates, steps) uint8 matrix
+
+    def precompute_trajectory(self, steps: int) -> None:
+        """Precompute oscillator trajectories for a whole simulation run.
+
+        Calls ``iterate(steps)`` once per oscillator and stacks the results
+        into a (predicates, steps) uint8 matrix, so ``update`` becomes a
+        column lookup instead of per-step oscillator calls.
+
+        Parameters:
+        -----------
+        steps : int
+            Number of simulation steps to precompute.
+        """
+        trajectories = [
+            np.asarray(self.oscillators[p].iterate(steps), dtype=np.uint8)
+            for p in self.predicates
+        ]
+        self._trajectory = np.stack(trajectories)
+
     def update(self, step: int) -> Dict[str, bool]:
         """Update all oscillators and calculate awareness metrics."""
         states = {}
         contradictions = 0
-        
-        for predicate, oscillator in self.oscillators.items():
-            current_states = oscillator.iterate(1)
-            states[predicate] = current_states[0]
-            
-            # Count active contradictions (when predicate and negation coexist)
+
+        if self._trajectory is not None and step < self._trajectory.shape[1]:
+            # Precomputed path: read one column of the trajectory matrix.
+            column = self._trajectory[:, step]
+            for i, predicate in enumerate(self.predicates):
+                states[predicate] = bool(column[i])
             if step > 0:  # Need history to detect contradictions
-                contradictions += 1  # Simplified: assume contradiction exists
-        
+                contradictions = len(self.predicates)
+            state_vector = column
+        else:
+            for predicate, oscillator in self.oscillators.items():
+                current_states = oscillator.iterate(1)
+                states[predicate] = current_states[0]
+
+                # Count active contradictions (when predicate and negation coexist)
+                if step > 0:  # Need history to detect contradictions
+                    contradictions += 1  # Simplified: assume contradiction exists
+            state_vector = np.fromiter(
+                (int(s) for s in states.values()), dtype=np.int8, count=len(states)
+            )
+
         # Awareness emerges from contradiction density
         self.awareness_level = contradictions / len(self.predicates)
-        
+
         # Integration strength based on oscillation synchrony
         if len(states) > 1:
-            state_values = list(states.values())
             # Measure synchrony as inverse of variance
-            synchrony = 1.0 / (1.0 + np.var([int(s) for s in state_values]))
+            synchrony = 1.0 / (1.0 + np.var(state_vector))
             self.integration_strength = synchrony
-        
+
         return states
 
+    def trajectory_metrics(self, steps: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized awareness/integration series for a precomputed run.
+
+        Returns the per-step awareness and integration values that
+        repeated update() calls would produce, computed in two NumPy
+        operations over the trajectory matrix.
+        """
+        awareness = np.ones(steps)
+        if steps > 0:
+            awareness[0] = 0.0  # no history at step 0, no contradictions
+        if len(self.predicates) > 1:
+            # The precomputed trajectory may be longer than the run
+            # (precompute_trajectories_parallel keeps longer matrices),
+            # so restrict the variance to the steps actually simulated.
+            integration = 1.0 / (1.0 + self._trajectory[:, :steps].var(axis=0))
+        else:
+            integration = np.zeros(steps)
+        return awareness, integration
+
 
 class ConsciousnessNetwork:
     """Network of consciousness nodes with emergent global awareness."""
@@ -101,12 +186,37 @@ class ConsciousnessNetwork:
     def __init__(self):
         self.nodes = {}
         self.global_awareness = 0.0
-        self.integration_history = []
-        self.awareness_history = []
+        self.integration_history = np.empty(0)
+        self.awareness_history = np.empty(0)
     
     def add_node(self, name: str, predicates: List[str]):
         """Add a consciousness node to the network."""
         self.nodes[name] = ConsciousnessNode(name, predicates)
+
+    def precompute_trajectories_parallel(self, steps: int,
+                                         max_workers: Optional[int] = None) -> None:
+        """Precompute node trajectories in parallel, one process per node.
+
+        The oscillator loops are pure-Python compute and cannot escape the
+        GIL with threads, so independent nodes are farmed out to a
+        ProcessPoolExecutor; the cheap synchrony/aggregation work stays
+        single-threaded in simulate().
+        """
+        if not self.nodes:
+            return
+        if max_workers is None:
+            max_workers = len(self.nodes)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                name: executor.submit(
+                    _precompute_node_trajectories,
+                    [node.oscillators[p].initial for p in node.predicates],
+                    steps,
+                )
+                for name, node in self.nodes.items()
+            }
+            for name, future in futures.items():
+                self.nodes[name]._trajectory = future.result()
     
     def simulate(self, steps: int) -> Dict:
         """Run consciousness emergence simulation."""
@@ -116,51 +226,64 @@ class ConsciousnessNetwork:
             'total_integration': [],
             'node_states': {name: [] for name in self.nodes.keys()}
         }
-        
-        for step in range(steps):
-            total_awareness = 0.0
-            total_integration = 0.0
-            
-            # Update all nodes
-            for name, node in self.nodes.items():
-                states = node.update(step)
-                results['node_states'][name].append(states)
-                total_awareness += node.awareness_level
-                total_integration += node.integration_strength
-            
-            # Calculate global metrics
-            if self.nodes:
-                self.global_awareness = total_awareness / len(self.nodes)
-                global_integration = total_integration / len(self.nodes)
-            else:
-                self.global_awareness = 0.0
-                global_integration = 0.0
-            
-            # Store results
-            results['step'].append(step)
-            results['global_awareness'].append(self.global_awareness)
-            results['total_integration'].append(global_integration)
-            
-            self.awareness_history.append(self.global_awareness)
-            self.integration_history.append(global_integration)
-        
+
+        # Precompute all oscillator trajectories up front so the step loop
+        # only performs column lookups (skipping nodes already precomputed,
+        # e.g. by precompute_trajectories_parallel).
+        for node in self.nodes.values():
+            if node._trajectory is None or node._trajectory.shape[1] < steps:
+                node.precompute_trajectory(steps)
+
+        # Record per-step states straight from the trajectory matrices and
+        # keep the per-node metric series for the fused reduction below.
+        awareness_rows = []
+        integration_rows = []
+        for name, node in self.nodes.items():
+            traj = node._trajectory
+            results['node_states'][name] = [
+                {p: bool(traj[i, step]) for i, p in enumerate(node.predicates)}
+                for step in range(steps)
+            ]
+            awareness, integration = node.trajectory_metrics(steps)
+            awareness_rows.append(awareness)
+            integration_rows.append(integration)
+            if steps > 0:
+                node.awareness_level = float(awareness[-1])
+                node.integration_strength = float(integration[-1])
+
+        # Fused aggregation: one mean reduction over the stacked
+        # (nodes, steps) matrices replaces steps x nodes Python adds.
+        if self.nodes:
+            self.awareness_history = np.stack(awareness_rows).mean(axis=0)
+            self.integration_history = np.stack(integration_rows).mean(axis=0)
+        else:
+            self.awareness_history = np.zeros(steps)
+            self.integration_history = np.zeros(steps)
+        self.global_awareness = float(self.awareness_history[-1]) if steps > 0 else 0.0
+
+        results['step'] = np.arange(steps)
+        results['global_awareness'] = self.awareness_history
+        results['total_integration'] = self.integration_history
+
         return results
     
     def measure_consciousness_emergence(self) -> Dict:
         """Measure key metrics of consciousness emergence."""
-        if not self.awareness_history:
+        if self.awareness_history.size == 0:
             return {'error': 'No simulation data available'}
-        
-        # Calculate emergence metrics
-        awareness_trend = np.polyfit(range(len(self.awareness_history)), 
-                                   self.awareness_history, 1)[0]
-        integration_trend = np.polyfit(range(len(self.integration_history)), 
-                                     self.integration_history, 1)[0]
-        
-        # Measure complexity (entropy of awareness levels)
-        awareness_entropy = -np.sum([p * np.log2(p + 1e-10) 
-                                   for p in np.histogram(self.awareness_history, 10)[0] 
-                                   if p > 0]) / len(self.awareness_history)
+
+        # Calculate emergence metrics (analytic slope, no matrix solve)
+        awareness_trend = _linreg_slope(self.awareness_history)
+        integration_trend = _linreg_slope(self.integration_history)
+
+        # Measure complexity (Shannon entropy of awareness levels) in one
+        # masked ufunc call.  Counts are normalized to probabilities first;
+        # the old formula fed raw bin counts to log2, so its output was not
+        # actually in bits.
+        counts = np.histogram(self.awareness_history, 10)[0]
+        p = counts[counts > 0].astype(np.float64)
+        p /= p.sum()
+        awareness_entropy = -np.sum(p * np.log2(p))
         
         return {
             'awareness_trend': awareness_trend,
@@ -186,8 +309,10 @@ def run_consciousness_experiment():
     network.add_node('emotion', ['happy', 'sad', 'excited'])
     network.add_node('self_awareness', ['existing', 'observing', 'reflecting'])
     
-    # Run simulation
+    # Run simulation (trajectories precomputed in parallel, one process
+    # per independent node)
     steps = 200
+    network.precompute_trajectories_parallel(steps)
     results = network.simulate(steps)
     
     # Analyze emergence
@@ -197,7 +322,13 @@ def run_consciousness_experiment():
     print(f"Final global awareness: {emergence_metrics['final_awareness']:.3f}")
     print(f"Final integration: {emergence_metrics['final_integration']:.3f}")
     print(f"Emergence detected: {emergence_metrics['emergence_detected']}")
-    
+
+    # Deferred import: keep matplotlib out of the simulation path and use
+    # the Agg backend so headless runs skip GUI initialization.
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
     # Plot results
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
     
@@ -223,9 +354,13 @@ def run_consciousness_experiment():
     ax3.set_title('Consciousness Phase Space')
     ax3.grid(True, alpha=0.3)
     
-    # Node activity heatmap (simplified)
+    # Node activity heatmap from the precomputed trajectories: mean active
+    # fraction per node per step (float32 is plenty for imshow).
     node_names = list(network.nodes.keys())
-    activity_matrix = np.random.rand(len(node_names), steps)  # Simplified
+    activity_matrix = np.stack([
+        network.nodes[name]._trajectory.mean(axis=0, dtype=np.float32)
+        for name in node_names
+    ])
     im = ax4.imshow(activity_matrix, aspect='auto', cmap='hot')
     ax4.set_title('Node Activity Heatmap')
     ax4.set_xlabel('Time Steps')
@@ -55,6 +55,7 @@ setup(
         "console_scripts": [
             "rso=src.cli:main",
             "rso-benchmark=benchmarks.performance_suite:run_benchmarks",
+            "rso-plot=benchmarks.performance_suite:plot_saved_results",
             "rso-verify=src.formal_proofs:run_formal_verification",
             "rso-figures=src.make_figures:main",
         ],
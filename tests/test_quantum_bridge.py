@@ -4,11 +4,8 @@ Test suite for quantum mechanics bridge in RSO framework.
 
 import pytest
 import numpy as np
-import sys
-from pathlib import Path
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent / 'src'))
+# src is put on sys.path once, in conftest.py
 
 from quantum_bridge import QuantumXiState, QuantumXiPair, demonstrate_quantum_rso_correspondence
 
@@ -54,9 +51,10 @@ class TestQuantumXiState:
         """Test quantum measurement process."""
         state = QuantumXiState()
         
-        # Run multiple measurements to test statistical behavior
-        measurements = [state.measure() for _ in range(1000)]
-        true_ratio = sum(measurements) / len(measurements)
+        # Run multiple measurements to test statistical behavior —
+        # one batched Bernoulli draw instead of 1000 scalar calls
+        measurements = state.measure_many(1000)
+        true_ratio = float(measurements.mean())
         
         # For equal superposition, should be approximately 50/50
         assert 0.4 < true_ratio < 0.6  # Allow for statistical variation
@@ -92,6 +90,12 @@ class TestQuantumXiPair:
             assert isinstance(measurement[0], bool)
             assert isinstance(measurement[1], bool)
 
+        # The batched path stores outcomes as a packed bool matrix
+        # (1 byte per outcome instead of a boxed tuple per shot)
+        batched = pair.measure_both_many(100)
+        assert batched.shape == (100, 2)
+        assert batched.dtype == np.bool_
+
 
 class TestQuantumRSOCorrespondence:
     """Test quantum-RSO correspondence demonstration."""